@@ -1,7 +1,18 @@
+import io
+
 import streamlit as st
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from datetime import date, time
 
+DEFAULT_DOB = date(2000, 1, 1)
+DEFAULT_ALARM = time(7, 30)
+COLORS = ("Red", "Green", "Blue", "Black")
+TOPPINGS = ("Onion", "Corn", "Paneer", "Mushroom")
+SIZES = ("S", "M", "L", "XL")
+PREVIEW_BYTES = 64 * 1024
+
 st.set_page_config(
     page_title="treamlit: Widgets & Interactivity", page_icon="🧩", layout="wide"
 )
@@ -34,19 +45,19 @@ with col2:
     age = st.number_input("Age", min_value=0, max_value=120, value=42, step=1)
     rating = st.slider("Satisfaction (1-10)", 0, 10, 7)
     window = st.slider("Select range", 0, 100, (25, 75))
-    st.write(f"Age: {age}, Rating: {rating}, Window: {window}")
+    st.markdown(f"**Age:** {age}  \n**Rating:** {rating}  \n**Window:** {window}")
 
 with col3:
     st.subheader("Choices and Time")
-    color = st.selectbox("Favorite color", ["Red", "Green", "Blue", "Black"], index=2)
-    toppings = st.multiselect(
-        "Pizza toppings", ["Onion", "Corn", "Paneer", "Mushroom"], default=["Paneer"]
+    color = st.selectbox("Favorite color", COLORS, index=2)
+    toppings = st.multiselect("Pizza toppings", TOPPINGS, default=["Paneer"])
+    size = st.radio("T-shirt size", SIZES, index=2, horizontal=True)
+    dob = st.date_input("Date of birth", value=DEFAULT_DOB)
+    alarm = st.time_input("Alarm time", value=DEFAULT_ALARM)
+    st.markdown(
+        f"**Color:** {color}  \n**Size:** {size}  \n**DOB:** {dob}  \n"
+        f"**Alarm:** {alarm}  \n:gray[Toppings chosen: {', '.join(toppings) or 'None'}]"
     )
-    size = st.radio("T-shirt size", ["S", "M", "L", "XL"], index=2, horizontal=True)
-    dob = st.date_input("Date of birth", value=date(2000, 1, 1))
-    alarm = st.time_input("Alarm time", value=time(7, 30))
-    st.write(f"Color={color}, Size={size}, DOB={dob}, Alarm={alarm}")
-    st.caption(f"Toppings chosen: {', '.join(toppings) or 'None'}")
 
 st.divider()
 
@@ -92,10 +103,65 @@ uploaded = st.file_uploader(
 
 if uploaded:
     try:
-        df = pd.read_csv(uploaded)
-        st.success(f"Loaded {df.shape[0]} rows × {df.shape[1]} cols")
-        st.dataframe(df.head(10), use_container_width=True)
-    except (pd.errors.ParserError, UnicodeDecodeError) as e:
+        # Tokenize only the first few KB for the preview; the full parse is opt-in
+        head_bytes = uploaded.read(PREVIEW_BYTES)
+        uploaded.seek(0)
+        truncated = uploaded.size > len(head_bytes)
+
+        if not truncated:
+            # The whole file fit in the sample, so the count is exact
+            df = pd.read_csv(io.BytesIO(head_bytes))
+            st.success(f"Loaded {df.shape[0]} rows × {df.shape[1]} cols")
+            st.dataframe(df.head(10), use_container_width=True)
+        else:
+            # Drop the partial last line so the preview never shows a cut-off row
+            last_nl = head_bytes.rfind(b"\n")
+            head_bytes = head_bytes[: last_nl + 1]
+
+            # Count parsed records, not newlines, so quoted line breaks don't
+            # inflate the estimate; a cut inside a quoted field leaves it unknown
+            try:
+                sample = pd.read_csv(io.BytesIO(head_bytes))
+                preview, sample_rows = sample.head(10), len(sample)
+            except (pd.errors.ParserError, pd.errors.EmptyDataError):
+                try:
+                    preview = pd.read_csv(io.BytesIO(head_bytes), nrows=10)
+                except (pd.errors.ParserError, pd.errors.EmptyDataError):
+                    preview = None
+                sample_rows = 0
+
+            if preview is None:
+                st.warning(
+                    f"No complete record in the first {PREVIEW_BYTES // 1024} KB, "
+                    "so a preview is not available."
+                )
+            else:
+                if sample_rows:
+                    est_rows = sample_rows * uploaded.size // len(head_bytes)
+                    st.success(
+                        f"≈{est_rows:,} rows × {preview.shape[1]} cols "
+                        f"({uploaded.size:,} bytes)"
+                    )
+                    st.caption(
+                        f"Rough row count extrapolated by byte size from the first "
+                        f"{PREVIEW_BYTES // 1024} KB."
+                    )
+                else:
+                    st.success(
+                        f"Rows unknown × {preview.shape[1]} cols "
+                        f"({uploaded.size:,} bytes)"
+                    )
+                st.dataframe(preview, use_container_width=True)
+
+            if st.button("Load full file"):
+                df = pd.read_csv(uploaded, engine="pyarrow")
+                st.success(f"Loaded {df.shape[0]} rows × {df.shape[1]} cols")
+    except (
+        pd.errors.ParserError,
+        pd.errors.EmptyDataError,
+        UnicodeDecodeError,
+        pa.ArrowInvalid,
+    ) as e:
         st.error(f"Failed to read CSV: {e}")
 else:
     st.info("No file uploaded yet. Try uploading a CSV file to preview it here.")
@@ -105,6 +171,15 @@ st.divider()
 st.header("4) Forms (submit-once pattern)")
 st.write("Use forms when you want to collect multiple inputs and submit them together.")
 
+
+# Vectorized so the same kernel can fill a sensitivity table from arrays
+def emi_vec(P, annual_rate, months):
+    r = np.asarray(annual_rate, dtype=np.float64) / 1200.0
+    g = (1.0 + r) ** months
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(r == 0, P / months, P * r * g / (g - 1.0))
+
+
 with st.form("loan_form", clear_on_submit=False):
     st.subheader("Simple EMI Calculator")
     P = st.number_input(
@@ -117,12 +192,7 @@ with st.form("loan_form", clear_on_submit=False):
     submitted = st.form_submit_button("Calculate EMI")
 
 if submitted:
-    r = annual_rate / 1200.0
-    if r == 0:
-        emi = P / months
-    else:
-        emi = P * r * (1 + r) ** months / ((1 + r) ** months - 1)
-
+    emi = float(emi_vec(P, annual_rate, months))
     st.success(f"Estimated EMI: ₹{emi:,.2f}")
 
 st.divider()
@@ -137,40 +207,67 @@ st.markdown(
 
 **Requirements**
 1. Create a text input labeled **"New task"** and an **"Add"** button.  
-2. Store tasks in `st.session_state["todos"]` as a list of dicts like `{"text": "...", "done": False}`.  
+2. Store tasks in `st.session_state["todos"]` as parallel lists like `{"text": [...], "done": [...]}`.  
 3. Render each task with a checkbox to mark it **done/undone**.  
 4. Add a **"Clear completed"** button to remove tasks where `done == True`.  
 """
 )
 
-# 1) Initialize storage for todos
-if "todos" not in st.session_state:
-    st.session_state.todos = []
-
-# 2) Input row
-new_task_col, add_btn_col = st.columns([4, 1])
-
-with new_task_col:
-    new_task = st.text_input("New Task", placeholder="Enter Todo Task")
-
-with add_btn_col:
-    # if st.button("Add"):
-    #     txt = new_task.strip()
-    #     if txt:
-    #         st.session_state.todos.append({"text": txt, "done": False})
-    st.markdown("<div style='margin-top: 28px;'>", unsafe_allow_html=True)
-    if st.button("Add"):
-        txt = new_task.strip()
-        if txt:
-            st.session_state.todos.append({"text": txt, "done": False})
-    st.markdown("</div>", unsafe_allow_html=True)
-
-# 3) Render tasks with checkboxes (use index-based unique keys)
-for i, todo in enumerate(st.session_state.todos):
-    checked = st.checkbox(todo["text"], value=todo["done"], key=f"todo_{i}")
-    st.session_state.todos[i]["done"] = checked
-
-# 4) Clear completed
-if st.button("Clear Completed"):
-    st.session_state.todos = [t for t in st.session_state.todos if not t["done"]]
-    st.rerun()
+
+def apply_todo_edits():
+    # Runs before the rerun, so the editor is rebuilt from already-updated data
+    for row, changes in st.session_state.todo_editor["edited_rows"].items():
+        for col, value in changes.items():
+            st.session_state.todos[col][row] = value
+
+
+@st.fragment
+def todo_section():
+    # 1) Initialize storage for todos
+    if "todos" not in st.session_state:
+        st.session_state.todos = {"text": [], "done": []}
+
+    # 2) Input row
+    new_task_col, add_btn_col = st.columns([4, 1], vertical_alignment="bottom")
+
+    with new_task_col:
+        new_task = st.text_input("New Task", placeholder="Enter Todo Task")
+
+    with add_btn_col:
+        if st.button("Add"):
+            txt = new_task.strip()
+            if txt:
+                st.session_state.todos["text"].append(txt)
+                st.session_state.todos["done"].append(False)
+
+    # 3) Render tasks as one editable table with a checkbox column
+    # Explicit dtypes keep an empty list editable (it would otherwise be float64)
+    todo_df = pd.DataFrame(st.session_state.todos).astype(
+        {"text": "object", "done": "bool"}
+    )
+    st.data_editor(
+        todo_df,
+        column_config={
+            "text": st.column_config.TextColumn("Task"),
+            "done": st.column_config.CheckboxColumn("Done"),
+        },
+        hide_index=True,
+        use_container_width=True,
+        key="todo_editor",
+        on_change=apply_todo_edits,
+    )
+
+    # 4) Clear completed
+    if st.button("Clear Completed"):
+        todos = st.session_state.todos
+        keep = [not d for d in todos["done"]]
+        st.session_state.todos = {
+            "text": [t for t, k in zip(todos["text"], keep) if k],
+            "done": [False] * sum(keep),
+        }
+        # Row positions shift, so drop the editor's pending edits as well
+        st.session_state.pop("todo_editor", None)
+        st.rerun(scope="fragment")
+
+
+todo_section()